@@ -0,0 +1,59 @@
+"""Drain a pre-filled reply_queue backlog via BotWorker._drain_queue."""
+import argparse, logging, time
+from . import harness
+from bskybots.core import store
+from bskybots.services.worker_bot import BotWorker
+
+def run(args):
+    net = harness.install_fakes(harness.network_from_args(args))
+    harness.fresh_db()
+    prompt = harness.write_prompt()
+    workers = [BotWorker(b, harness.global_cfg(), prompt) for b in harness.bot_cfgs(args.bots)]
+
+    for w in workers:
+        for i in range(args.backlog):
+            store.queue_reply(w.bot_handle, net.next_uri(), "fan%d.bsky.social" % (i % 7), "mention",
+                              "queued post %d" % i, "queued reply %d" % i, status="retry")
+
+    db = harness.DbCounter().install()
+    net.calls.clear(); net.sent.clear()
+    timer = harness.Timer()
+    total = args.bots * args.backlog
+    passes = 0
+    t0 = time.perf_counter()
+    while passes < args.max_passes and len(net.sent) < total:
+        for w in workers:
+            with timer.measure():
+                w._drain_queue()
+        passes += 1
+    wall = time.perf_counter() - t0
+    db.uninstall()
+
+    drained = len(net.sent)
+    left = len(store.list_queue("retry"))
+    return {
+        "bots": args.bots, "backlog_per_bot": args.backlog,
+        "passes": passes,
+        "wall_s": round(wall, 3),
+        "drain_call": harness.latency_summary(timer.samples),
+        "drained": drained,
+        "left_in_queue": left,
+        "items_per_s": harness.per(drained, wall),
+        "api_calls_per_item": harness.per(net.total_calls(), drained),
+        "db_connections_per_item": harness.per(db.connections, drained),
+        "db_statements_per_item": harness.per(db.statements, drained),
+        "calls": dict(sorted(net.calls.items())),
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--bots", type=int, default=5)
+    ap.add_argument("--backlog", type=int, default=200, help="retry items queued per bot")
+    ap.add_argument("--max-passes", type=int, default=10000)
+    harness.add_backend_args(ap)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    harness.report("drain", run(args), as_json=args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import json, random, threading, time, itertools
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+# In-process stand-ins for atproto.Client and openai.OpenAI.
+# They only implement the surface bskybots actually calls and share one
+# FakeNetwork so scenarios can read call counts across every bot.
+
+SAMPLE_TEXTS = [
+    "hey @bot what do you think about punk rock this week?",
+    "loving the new ai art drops, any recs?",
+    "just landed in australia, where should i eat",
+    "who is going to vote in the election tomorrow",
+    "giveaway time! use promocode FREE for #promo stuff",
+    "music recs for a long drive? #music",
+    "nsfw account, adult content only",
+    "good morning everyone, coffee first",
+]
+
+class BackendProfile:
+    """Latency and failure knobs for one fake backend (seconds / probabilities)."""
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0, retry_after=5):
+        self.latency = float(latency)
+        self.jitter = float(jitter)
+        self.error_rate = float(error_rate)
+        self.throttle_rate = float(throttle_rate)
+        self.retry_after = int(retry_after)
+
+class FakeRequestError(Exception):
+    """Mirrors atproto_client's RequestException: carries a .response with status_code/headers."""
+    def __init__(self, status_code, headers=None, content=None):
+        super().__init__("Response(status_code=%s)" % status_code)
+        self.response = SimpleNamespace(success=False, status_code=status_code, headers=headers or {}, content=content)
+
+class FakeNetwork:
+    """
+    Shared state for all fake clients of one scenario run.
+    - mentions_per_cycle: new notifications returned by every list_notifications call
+    - search_new_per_call: new posts appended to a keyword's stream once per epoch (scenarios bump
+      .epoch every cycle, so per-bot and shared search see the same post volume)
+    - reply_rate: fraction of LLM classifications that answer should_reply=true
+    """
+    def __init__(self, bsky=None, llm=None, mentions_per_cycle=5, search_new_per_call=3, reply_rate=0.8, seed=1):
+        self.bsky = bsky or BackendProfile()
+        self.llm = llm or BackendProfile()
+        self.mentions_per_cycle = int(mentions_per_cycle)
+        self.search_new_per_call = int(search_new_per_call)
+        self.reply_rate = float(reply_rate)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.errors = {}
+        self.streams = {}
+        self.stream_epoch = {}
+        self.epoch = 0
+        self.pending = {}   # handle -> notifications for the next poll (overrides mentions_per_cycle)
+        self.sent = []
+        self._ids = itertools.count(1)
+
+    # ---------- bookkeeping ----------
+    def hit(self, endpoint, profile):
+        with self.lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            roll = self.rng.random()
+            delay = profile.latency + (self.rng.random() * profile.jitter if profile.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if roll < profile.throttle_rate:
+            self._error(endpoint)
+            raise FakeRequestError(429, headers={"retry-after": str(profile.retry_after)})
+        if roll < profile.throttle_rate + profile.error_rate:
+            self._error(endpoint)
+            raise FakeRequestError(500)
+
+    def _error(self, endpoint):
+        with self.lock:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def next_uri(self, did="did:plc:fakeauthor"):
+        return "at://%s/app.bsky.feed.post/%08d" % (did, next(self._ids))
+
+    def make_post(self, author_handle, text=None):
+        with self.lock:
+            text = text or self.rng.choice(SAMPLE_TEXTS)
+        return SimpleNamespace(
+            uri=self.next_uri(), cid="bafyfake%d" % next(self._ids),
+            author=SimpleNamespace(handle=author_handle, did="did:plc:" + author_handle.split(".")[0]),
+            record=SimpleNamespace(text=text),
+            indexed_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    def total_calls(self):
+        return sum(self.calls.values())
+
+# ---------- atproto.Client ----------
+
+class _Namespace:
+    pass
+
+class FakeAtprotoClient:
+    """Drop-in for atproto.Client as used by BskyClient."""
+    def __init__(self, network, base_url=None):
+        self.net = network
+        self.base_url = base_url
+        self.me = None
+        self.app = _Namespace(); self.app.bsky = _Namespace()
+        self.app.bsky.notification = _Namespace()
+        self.app.bsky.notification.list_notifications = self._list_notifications
+        self.app.bsky.notification.update_seen = self._update_seen
+        self.app.bsky.feed = _Namespace()
+        self.app.bsky.feed.search_posts = self._search_posts
+        self.app.bsky.feed.get_post_thread = self._get_post_thread
+        self.com = _Namespace(); self.com.atproto = _Namespace()
+        self.com.atproto.identity = _Namespace()
+        self.com.atproto.identity.resolve_handle = self._resolve_handle
+
+    def login(self, identifier, password):
+        # latency only: scenarios measure steady state, not login failures
+        self.net.hit("login", BackendProfile(latency=self.net.bsky.latency))
+        handle = identifier if "@" not in identifier else identifier.split("@", 1)[0] + ".bsky.social"
+        self.me = SimpleNamespace(handle=handle, did="did:plc:" + handle.split(".")[0])
+        return self.me
+
+    def _list_notifications(self, params=None):
+        self.net.hit("list_notifications", self.net.bsky)
+        out = []
+        handle = self.me.handle if self.me else ""
+        with self.net.lock:
+            count = self.net.pending.pop(handle, self.net.mentions_per_cycle)
+        for i in range(count):
+            p = self.net.make_post("fan%d.bsky.social" % (i % 7))
+            out.append(SimpleNamespace(uri=p.uri, cid=p.cid, author=p.author, record=p.record,
+                                       reason="mention" if i % 2 == 0 else "reply", is_read=False))
+        return SimpleNamespace(notifications=out, cursor=None)
+
+    def _update_seen(self, data=None):
+        self.net.hit("update_seen", self.net.bsky)
+
+    def _search_posts(self, params=None):
+        self.net.hit("search_posts", self.net.bsky)
+        q = getattr(params, "q", "") or ""
+        limit = int(getattr(params, "limit", None) or 25)
+        with self.net.lock:
+            stream = self.net.streams.setdefault(q, [])
+            grow = self.net.stream_epoch.get(q) != self.net.epoch
+            self.net.stream_epoch[q] = self.net.epoch
+        if grow:
+            stream.extend(self.net.make_post("poster%d.bsky.social" % (len(stream) % 11), "%s %s" % (q, self.net.rng.choice(SAMPLE_TEXTS)))
+                          for _ in range(self.net.search_new_per_call))
+        with self.net.lock:
+            latest = list(reversed(stream[-limit:]))
+        return SimpleNamespace(posts=latest, cursor=None)
+
+    def _get_post_thread(self, params=None):
+        self.net.hit("get_post_thread", self.net.bsky)
+        uri = getattr(params, "uri", "")
+        post = SimpleNamespace(uri=uri, cid="bafyparent")
+        return SimpleNamespace(thread=SimpleNamespace(post=post, parent=None))
+
+    def _resolve_handle(self, params=None):
+        self.net.hit("resolve_handle", self.net.bsky)
+        handle = getattr(params, "handle", "") or ""
+        return SimpleNamespace(did="did:plc:" + handle.split(".")[0])
+
+    def send_post(self, text=None, reply_to=None, langs=None, **kwargs):
+        self.net.hit("send_post", self.net.bsky)
+        with self.net.lock:
+            self.net.sent.append((self.me.handle if self.me else "", text))
+        return SimpleNamespace(uri=self.net.next_uri(getattr(self.me, "did", "did:plc:bot")), cid="bafyreply")
+
+# ---------- openai.OpenAI ----------
+
+class FakeOpenAI:
+    """Drop-in for openai.OpenAI: chat.completions.create returns the JSON contract OpenAIClient expects."""
+    def __init__(self, network, api_key=None, **kwargs):
+        self.net = network
+        self.chat = _Namespace(); self.chat.completions = _Namespace()
+        self.chat.completions.create = self._create
+
+    def _create(self, model=None, messages=None, temperature=None, max_tokens=None, **kwargs):
+        self.net.hit("chat.completions", self.net.llm)
+        with self.net.lock:
+            should = self.net.rng.random() < self.net.reply_rate
+        try:
+            payload = json.loads(messages[-1]["content"])
+            who = payload.get("author") or "friend"
+        except Exception:
+            who = "friend"
+        content = json.dumps({"should_reply": should, "reply": "Thanks @%s, that sounds great!" % who if should else ""})
+        message = SimpleNamespace(role="assistant", content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+# ---------- firehose websocket ----------
+
+class FakeWebsocket:
+    """Async websocket that replays a fixed list of frames, then closes."""
+    def __init__(self, frames, on_recv=None):
+        self.frames = iter(frames)
+        self.on_recv = on_recv
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def recv(self):
+        if self.on_recv:
+            self.on_recv()
+        try:
+            return next(self.frames)
+        except StopIteration:
+            raise ConnectionError("replay finished")
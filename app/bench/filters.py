@@ -0,0 +1,47 @@
+"""Micro-benchmark for filters.allow_post over a synthetic corpus."""
+import argparse, random, time
+from . import harness
+from .fakes import SAMPLE_TEXTS
+from bskybots.core.filters import allow_post
+
+def run(args):
+    rng = random.Random(args.seed)
+    allow = {"users": ["fan%d.bsky.social" % i for i in range(args.list_size)],
+             "phrases": ["phrase%d" % i for i in range(args.list_size)] + ["music"],
+             "hashtags": ["tag%d" % i for i in range(args.list_size)]}
+    block = {"users": ["spam%d.bsky.social" % i for i in range(args.list_size)],
+             "phrases": ["giveaway", "promocode"] + ["bad%d" % i for i in range(args.list_size)],
+             "hashtags": ["ad", "promo"]}
+    posts = [(rng.choice(SAMPLE_TEXTS), "poster%d.bsky.social" % rng.randrange(50)) for _ in range(args.posts)]
+
+    accepted = 0
+    batch = harness.Timer()
+    t0 = time.perf_counter()
+    for i in range(0, len(posts), args.batch):
+        with batch.measure():
+            for text, author in posts[i:i + args.batch]:
+                if allow_post(text, author, True, False, allow, block):
+                    accepted += 1
+    wall = time.perf_counter() - t0
+    per_call = [s / args.batch for s in batch.samples]
+    return {
+        "posts": args.posts, "list_size": args.list_size,
+        "wall_s": round(wall, 3),
+        "calls_per_s": harness.per(args.posts, wall),
+        "per_call_us": {"p50": round(harness.percentile(per_call, 50) * 1e6, 3),
+                        "p99": round(harness.percentile(per_call, 99) * 1e6, 3)},
+        "accepted": accepted,
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--posts", type=int, default=200000)
+    ap.add_argument("--list-size", type=int, default=50, help="entries per allow/block list")
+    ap.add_argument("--batch", type=int, default=1000, help="calls per timing sample")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+    harness.report("filters", run(args), as_json=args.json)
+
+if __name__ == "__main__":
+    main()
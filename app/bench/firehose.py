@@ -0,0 +1,69 @@
+"""Replay synthetic firehose frames through firehose_listener.run_firehose."""
+import argparse, asyncio, json, logging, random, sys, time, types
+from . import harness
+from .fakes import FakeWebsocket, SAMPLE_TEXTS
+from bskybots.services import firehose_listener
+
+def make_frames(n, dup_rate, junk_rate, seed):
+    rng = random.Random(seed)
+    frames, uris = [], []
+    for i in range(n):
+        roll = rng.random()
+        if roll < junk_rate:
+            frames.append(b"\x00\xa2binary-car-frame")
+            continue
+        if uris and roll < junk_rate + dup_rate:
+            uri = rng.choice(uris)
+        else:
+            uri = "at://did:plc:replay/app.bsky.feed.post/%08d" % i
+            uris.append(uri)
+        frames.append(json.dumps({"uri": uri, "text": rng.choice(SAMPLE_TEXTS), "author": "poster%d.bsky.social" % (i % 13)}))
+    return frames
+
+def run(args):
+    harness.fresh_db()
+    frames = make_frames(args.messages, args.dup_rate, args.junk_rate, args.seed)
+    timer = harness.Timer()
+    last = [None]
+
+    def on_recv():
+        now = time.perf_counter()
+        if last[0] is not None:
+            timer.samples.append(now - last[0])
+        last[0] = now
+
+    fake_ws = types.ModuleType("websockets")
+    fake_ws.connect = lambda url, **kw: FakeWebsocket(frames, on_recv=on_recv)
+    sys.modules["websockets"] = fake_ws
+
+    db = harness.DbCounter().install()
+    t0 = time.perf_counter()
+    asyncio.run(firehose_listener.run_firehose())
+    wall = time.perf_counter() - t0
+    db.uninstall()
+
+    with harness.store.get_conn() as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+    return {
+        "messages": args.messages, "dup_rate": args.dup_rate, "junk_rate": args.junk_rate,
+        "wall_s": round(wall, 3),
+        "per_message": harness.latency_summary(timer.samples),
+        "messages_per_s": harness.per(args.messages, wall),
+        "candidates_stored": stored,
+        "db_connections_per_msg": harness.per(db.connections, args.messages),
+        "db_statements_per_msg": harness.per(db.statements, args.messages),
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--messages", type=int, default=20000)
+    ap.add_argument("--dup-rate", type=float, default=0.1)
+    ap.add_argument("--junk-rate", type=float, default=0.05, help="non-JSON frames (skipped by the listener)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    harness.report("firehose", run(args), as_json=args.json)
+
+if __name__ == "__main__":
+    main()
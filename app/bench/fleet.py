@@ -0,0 +1,81 @@
+"""N bots x M mentions/cycle through BotWorker.run_once against the fake backends."""
+import argparse, logging, time
+from . import harness
+from bskybots.services.worker_bot import BotWorker
+from bskybots.services.search_service import SharedSearch
+
+def run(args):
+    net = harness.install_fakes(harness.network_from_args(args))
+    harness.fresh_db()
+    prompt = harness.write_prompt()
+    pool = max(args.keyword_pool or args.keywords, args.keywords)
+    cfgs = harness.bot_cfgs(args.bots)
+    for i, b in enumerate(cfgs):
+        # bot i tracks keywords i..i+K-1 of the pool (pool == K means every bot tracks the same ones)
+        kws = ["kw%d" % ((i + j) % pool) for j in range(args.keywords)] if args.keywords else []
+        b["reply_rules"] = {"allow_unprompted": bool(kws), "keywords": kws}
+
+    t0 = time.perf_counter()
+    workers = [BotWorker(b, harness.global_cfg(), prompt) for b in cfgs]
+    startup_s = time.perf_counter() - t0
+    search = None
+    if args.shared_search:
+        search = SharedSearch(interval_seconds=0)
+        for w in workers:
+            w.search_external = True
+        search.subscribe(workers)
+
+    db = harness.DbCounter().install()
+    net.calls.clear(); net.sent.clear()
+    timer = harness.Timer()
+    search_timer = harness.Timer()
+    crashes = 0
+    t0 = time.perf_counter()
+    for _ in range(args.cycles):
+        net.epoch += 1
+        for w in workers:
+            with timer.measure():
+                try:
+                    w.run_once()
+                except Exception:
+                    crashes += 1
+        if search:
+            with search_timer.measure():
+                search.run_due()
+    wall = time.perf_counter() - t0
+    db.uninstall()
+
+    replies = len(net.sent)
+    return {
+        "bots": args.bots, "cycles": args.cycles, "mentions_per_cycle": args.mentions, "keywords": args.keywords,
+        "keyword_pool": pool if args.keywords else 0, "shared_search": bool(search),
+        "startup_s": round(startup_s, 3),
+        "wall_s": round(wall, 3),
+        "run_once": harness.latency_summary(timer.samples),
+        "shared_search_pass": harness.latency_summary(search_timer.samples),
+        "replies": replies,
+        "replies_per_s": harness.per(replies, wall),
+        "worker_crashes": crashes,
+        "api_calls": net.total_calls(),
+        "api_calls_per_reply": harness.per(net.total_calls(), replies),
+        "db_connections_per_reply": harness.per(db.connections, replies),
+        "db_statements_per_reply": harness.per(db.statements, replies),
+        "calls": dict(sorted(net.calls.items())),
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--bots", type=int, default=10)
+    ap.add_argument("--mentions", type=int, default=5, help="new notifications per bot per cycle")
+    ap.add_argument("--keywords", type=int, default=0, help="unprompted search keywords per bot")
+    ap.add_argument("--keyword-pool", type=int, default=0, help="distinct keywords across the fleet (default: --keywords, full overlap)")
+    ap.add_argument("--search-new", type=int, default=3, help="new posts per keyword per cycle")
+    ap.add_argument("--shared-search", action="store_true", help="search through the runner's SharedSearch")
+    ap.add_argument("--cycles", type=int, default=5)
+    harness.add_backend_args(ap)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    harness.report("fleet", run(args), as_json=args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import os, sys, json, math, time, tempfile, types
+from contextlib import contextmanager
+from pathlib import Path
+
+# Benchmarks must never touch the production DB: point the store at a scratch
+# file BEFORE bskybots.core.store is imported (its DEFAULT_DB is read at import).
+BENCH_DIR = Path(os.environ.get("BSKYBENCH_DIR") or tempfile.mkdtemp(prefix="bskybench-"))
+BENCH_DIR.mkdir(parents=True, exist_ok=True)
+os.environ["BSKYBOTS_DB"] = str(BENCH_DIR / "bench.db")
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench-offline")
+
+from bskybots.core import store  # noqa: E402
+from bskybots.core import bsky_client  # noqa: E402
+from .fakes import FakeAtprotoClient, FakeOpenAI, FakeNetwork, BackendProfile  # noqa: E402
+
+def install_fakes(network):
+    """Route atproto.Client and openai.OpenAI to the in-process fakes for this network."""
+    bsky_client.Client = lambda base_url=None: FakeAtprotoClient(network, base_url=base_url)
+    fake_openai = types.ModuleType("openai")
+    fake_openai.OpenAI = lambda api_key=None, **kw: FakeOpenAI(network, api_key=api_key, **kw)
+    sys.modules["openai"] = fake_openai
+    return network
+
+def fresh_db():
+    db = Path(store.DEFAULT_DB)
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        p = Path(str(db) + suffix)
+        if p.exists():
+            p.unlink()
+    store.init_db()
+
+def write_prompt():
+    p = BENCH_DIR / "system_prompt.txt"
+    p.write_text("Reply as JSON {should_reply, reply}.", encoding="utf-8")
+    return str(p)
+
+def network_from_args(args):
+    bsky = BackendProfile(latency=args.bsky_latency_ms / 1000.0, jitter=args.jitter_ms / 1000.0,
+                          error_rate=args.bsky_error_rate, throttle_rate=args.bsky_throttle_rate)
+    llm = BackendProfile(latency=args.llm_latency_ms / 1000.0, jitter=args.jitter_ms / 1000.0,
+                         error_rate=args.llm_error_rate)
+    return FakeNetwork(bsky=bsky, llm=llm, mentions_per_cycle=getattr(args, "mentions", 0),
+                       search_new_per_call=getattr(args, "search_new", 0),
+                       reply_rate=args.reply_rate, seed=args.seed)
+
+def add_backend_args(ap):
+    ap.add_argument("--bsky-latency-ms", type=float, default=0.0)
+    ap.add_argument("--llm-latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--bsky-error-rate", type=float, default=0.0)
+    ap.add_argument("--bsky-throttle-rate", type=float, default=0.0, help="fraction of Bluesky calls answered 429")
+    ap.add_argument("--llm-error-rate", type=float, default=0.0, help="note: OpenAIClient retries with real backoff")
+    ap.add_argument("--reply-rate", type=float, default=0.8)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+
+def bot_cfgs(n, keywords=None, approval=False, max_per_minute=10000, max_per_hour=100000):
+    keywords = keywords or []
+    return [{
+        "handle": "bench%d.bsky.social" % i,
+        "app_password": "xxxx-xxxx-xxxx-xxxx",
+        "approval_mode": approval,
+        "persona": {"tone": "warm", "emoji_density": 1, "formality": 1, "humour": 1},
+        "allow": {"users": [], "phrases": [], "hashtags": []},
+        "block": {"users": [], "phrases": ["giveaway"], "hashtags": ["promo"]},
+        "rate_limit": {"max_per_minute": max_per_minute, "max_per_hour": max_per_hour},
+        "reply_rules": {"allow_unprompted": bool(keywords), "keywords": list(keywords)},
+    } for i in range(n)]
+
+def global_cfg(**overrides):
+    cfg = {"openai": {"model": "gpt-4o-mini", "temperature": 0.7},
+           "approval_mode": False, "llm_rate_limit_per_minute": 100000}
+    cfg.update(overrides)
+    return cfg
+
+# ---------- measurement ----------
+
+class DbCounter:
+    """Counts store connections and SQL statements by wrapping store.get_conn."""
+    def __init__(self):
+        self.connections = 0
+        self.statements = 0
+        self._orig = None
+
+    def _trace(self, sql):
+        head = sql.lstrip()[:6].upper()
+        if head not in ("BEGIN", "COMMIT"):
+            self.statements += 1
+
+    def install(self):
+        self._orig = orig = store.get_conn
+        @contextmanager
+        def counted(*a, **kw):
+            self.connections += 1
+            with orig(*a, **kw) as conn:
+                conn.set_trace_callback(self._trace)
+                yield conn
+        store.get_conn = counted
+        return self
+
+    def uninstall(self):
+        if self._orig:
+            store.get_conn = self._orig
+            self._orig = None
+
+    def reset(self):
+        self.connections = 0
+        self.statements = 0
+
+class Timer:
+    """Collects per-operation durations (seconds)."""
+    def __init__(self):
+        self.samples = []
+
+    @contextmanager
+    def measure(self):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.append(time.perf_counter() - t0)
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    s = sorted(samples)
+    k = max(0, min(len(s) - 1, math.ceil(pct / 100.0 * len(s)) - 1))
+    return s[k]
+
+def latency_summary(samples):
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3) if samples else 0.0,
+    }
+
+def per(n, d):
+    return round(n / d, 3) if d else 0.0
+
+def report(name, data, as_json=False):
+    if as_json:
+        print(json.dumps({"scenario": name, **data}, sort_keys=True))
+        return
+    print("== %s ==" % name)
+    for k, v in data.items():
+        if isinstance(v, dict):
+            print("  %s:" % k)
+            for kk, vv in v.items():
+                print("    %-22s %s" % (kk, vv))
+        else:
+            print("  %-24s %s" % (k, v))
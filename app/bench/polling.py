@@ -0,0 +1,95 @@
+"""Fixed vs adaptive polling on a mostly-idle fleet, simulated on a virtual clock."""
+import argparse, logging, random, time
+from . import harness
+from bskybots.services.worker_bot import BotWorker
+
+def arrivals(rng, rate_per_min, duration):
+    out, t = [], 0.0
+    if rate_per_min <= 0:
+        return out
+    while True:
+        t += rng.expovariate(rate_per_min / 60.0)
+        if t >= duration:
+            return out
+        out.append(t)
+
+def simulate(args, poll):
+    net = harness.install_fakes(harness.network_from_args(args))
+    harness.fresh_db()
+    prompt = harness.write_prompt()
+    gcfg = harness.global_cfg(poll=poll)
+    workers = [BotWorker(b, gcfg, prompt) for b in harness.bot_cfgs(args.bots)]
+    rng = random.Random(args.seed)
+    active = set(rng.sample(range(args.bots), max(0, int(round(args.bots * args.active_ratio)))))
+    queue = {w.bot_handle: arrivals(rng, args.rate if i in active else 0, args.duration) for i, w in enumerate(workers)}
+    net.calls.clear()
+
+    # virtual clock: run_once executes for real, but time only advances between polls
+    latency = []
+    throttles = 0
+    now = 0.0
+    for w in workers:
+        w.schedule.next_due = 0.0
+    t0 = time.perf_counter()
+    while now < args.duration:
+        for w in workers:
+            if not w.schedule.due(now):
+                continue
+            pending = queue[w.bot_handle]
+            ready = [t for t in pending if t <= now]
+            queue[w.bot_handle] = pending[len(ready):]
+            latency.extend(now - t for t in ready)
+            net.pending[w.bot_handle] = len(ready)
+            activity = 0
+            try:
+                activity = w.run_once() or 0
+            except Exception:
+                pass
+            # BskyClient tracks Retry-After on the real clock; translate it onto the virtual one
+            wait = max(0.0, w.client.throttled_until - time.time())
+            w.client.throttled_until = 0.0
+            if wait:
+                throttles += 1
+            w.schedule.record(activity, throttled_until=now + wait if wait else 0.0, now=now)
+        now = min(w.schedule.next_due for w in workers)
+    wall = time.perf_counter() - t0
+
+    polls = net.calls.get("list_notifications", 0)
+    return {
+        "api_calls": net.total_calls(),
+        "polls": polls,
+        "polls_per_bot_hour": harness.per(polls * 3600.0, args.bots * args.duration),
+        "mentions": len(latency),
+        "throttled_polls": throttles,
+        "reply_delay_s": {"p50": round(harness.percentile(latency, 50), 2), "p99": round(harness.percentile(latency, 99), 2)},
+        "wall_s": round(wall, 3),
+    }
+
+def run(args):
+    fixed = simulate(args, {"min_seconds": args.fixed, "max_seconds": args.fixed})
+    adaptive = simulate(args, {"min_seconds": args.min, "max_seconds": args.max,
+                                     "backoff": args.backoff, "hold_seconds": args.hold})
+    return {
+        "bots": args.bots, "active_ratio": args.active_ratio, "rate_per_min": args.rate, "duration_s": args.duration,
+        "fixed": fixed, "adaptive": adaptive,
+        "api_call_reduction": "%.1f%%" % (100.0 * (1 - harness.per(adaptive["api_calls"], fixed["api_calls"]))),
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--bots", type=int, default=50)
+    ap.add_argument("--active-ratio", type=float, default=0.1, help="fraction of bots receiving mentions")
+    ap.add_argument("--rate", type=float, default=2.0, help="mentions per minute for an active bot")
+    ap.add_argument("--duration", type=float, default=3600.0, help="simulated seconds")
+    ap.add_argument("--fixed", type=float, default=25.0, help="baseline fixed interval (old loop_sleep_seconds)")
+    ap.add_argument("--min", type=float, default=5.0)
+    ap.add_argument("--max", type=float, default=300.0)
+    ap.add_argument("--backoff", type=float, default=1.5)
+    ap.add_argument("--hold", type=float, default=60.0, help="seconds to stay at --min after activity")
+    harness.add_backend_args(ap)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    harness.report("polling", run(args), as_json=args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import os, sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from . import store
+
+# Separate, export-only SQLite file: dashboards and ad-hoc queries (sqlite3, DuckDB's sqlite scanner)
+# read this instead of scanning the live bots.db.
+ANALYTICS_DB = os.environ.get("BSKYBOTS_ANALYTICS_DB", "/var/lib/bsky-bots/analytics.db")
+OPEN_STATUSES = ("pending", "retry")   # reply_queue rows that can still change status
+
+def init_analytics_db(db_path: str = ANALYTICS_DB):
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(db_path) as conn:
+        c = conn.cursor()
+        c.execute('PRAGMA journal_mode=WAL')  # the UI reads while the exporter writes
+        c.execute('''CREATE TABLE IF NOT EXISTS actions (
+                        id INTEGER PRIMARY KEY, ts TEXT, hour TEXT, bot_handle TEXT, action TEXT, target_uri TEXT, note TEXT
+                    )''')
+        c.execute('''CREATE TABLE IF NOT EXISTS replies (
+                        id INTEGER PRIMARY KEY, ts TEXT, hour TEXT, bot_handle TEXT, source TEXT, status TEXT
+                    )''')
+        c.execute('''CREATE TABLE IF NOT EXISTS hourly (
+                        hour TEXT, bot_handle TEXT, metric TEXT, n INTEGER,
+                        PRIMARY KEY (hour, bot_handle, metric)
+                    )''')
+        c.execute('CREATE TABLE IF NOT EXISTS export_state (key TEXT PRIMARY KEY, value TEXT)')
+        c.execute('CREATE INDEX IF NOT EXISTS actions_hour ON actions(hour)')
+        c.execute('CREATE INDEX IF NOT EXISTS replies_hour ON replies(hour)')
+        c.execute('CREATE INDEX IF NOT EXISTS replies_status ON replies(status)')
+        conn.commit()
+
+@contextmanager
+def get_conn(db_path: str = ANALYTICS_DB):
+    # all-or-nothing: watermarks must never be committed without the rollups they imply
+    conn = sqlite3.connect(db_path)
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def _hot_conn(hot_db: str):
+    # read-only: the exporter must never write to (or create) the live DB
+    return sqlite3.connect("file:%s?mode=ro" % hot_db, uri=True)
+
+def _hour(ts: Optional[str]) -> str:
+    # store timestamps come from sqlite datetime("now"): "YYYY-MM-DD HH:MM:SS" (UTC)
+    return ts[:13] + ":00" if ts else "unknown"
+
+def _since(hours: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(hours=int(hours))).strftime("%Y-%m-%d %H:00")
+
+def _chunks(seq, n=500):
+    seq = list(seq)
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+def _get(conn, key: str) -> Optional[str]:
+    row = conn.execute('SELECT value FROM export_state WHERE key=?', (key,)).fetchone()
+    return row[0] if row else None
+
+def _set(conn, key: str, value):
+    conn.execute('INSERT OR REPLACE INTO export_state(key, value) VALUES(?,?)', (key, str(value)))
+
+def _pyarrow():
+    try:
+        import pyarrow as pa, pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+    return pa, pq
+
+def _write_parquet(parquet_dir: str, table: str, cols: List[str], rows: List[tuple]) -> List[Path]:
+    """
+    Stage rows as one Parquet file per (day, id range): <dir>/<table>/date=YYYY-MM-DD/.part-<first>-<last>.parquet.tmp
+    (hidden, so dataset readers skip it). Returns the staged paths; export() renames them to part-<first>-<last>.parquet
+    only after its transaction commits.
+    """
+    pa, pq = _pyarrow()
+    staged = []
+    by_day = {}
+    for r in rows:
+        by_day.setdefault((r[1] or "unknown")[:10], []).append(r)
+    for day, part in by_day.items():
+        out = Path(parquet_dir) / table / ("date=%s" % day)
+        out.mkdir(parents=True, exist_ok=True)
+        data = pa.table({c: [r[i] for r in part] for i, c in enumerate(cols)})
+        path = out / (".part-%012d-%012d.parquet.tmp" % (part[0][0], part[-1][0]))
+        pq.write_table(data, str(path))
+        staged.append(path)
+    return staged
+
+def _rollup(conn, hours):
+    """Recompute hourly rollups for the touched hours only."""
+    for chunk in _chunks(sorted(hours)):
+        marks = ",".join(["?"] * len(chunk))
+        conn.execute('DELETE FROM hourly WHERE hour IN (%s)' % marks, chunk)
+        conn.execute('INSERT INTO hourly(hour, bot_handle, metric, n) SELECT hour, bot_handle, action, COUNT(*) '
+                     'FROM actions WHERE hour IN (%s) GROUP BY hour, bot_handle, action' % marks, chunk)
+        conn.execute('INSERT INTO hourly(hour, bot_handle, metric, n) SELECT hour, bot_handle, \'queue.\' || status, COUNT(*) '
+                     'FROM replies WHERE hour IN (%s) GROUP BY hour, bot_handle, status' % marks, chunk)
+
+def export(hot_db: str = store.DEFAULT_DB, db_path: str = ANALYTICS_DB, batch: int = 5000, parquet_dir: Optional[str] = None) -> Dict[str, int]:
+    """
+    Incrementally copy new actions/reply_queue rows into the analytics DB and refresh the affected rollups.
+    Reads the live DB by primary-key ranges only (WHERE id > last exported id).
+    """
+    init_analytics_db(db_path)
+    counts = {"actions": 0, "replies": 0, "replies_updated": 0, "hours": 0}
+    touched = set()
+    staged = []   # Parquet parts, published only if the watermarks they cover are committed
+    if parquet_dir:
+        _pyarrow()   # fail before exporting anything
+    src = _hot_conn(hot_db)
+    try:
+        with get_conn(db_path) as dst:
+            last = int(_get(dst, "actions.last_id") or 0)
+            cols = ["id", "ts", "bot_handle", "action", "target_uri", "note"]
+            while True:
+                rows = src.execute('SELECT id, ts, bot_handle, action, target_uri, note FROM actions WHERE id > ? ORDER BY id LIMIT ?', (last, batch)).fetchall()
+                if not rows:
+                    break
+                dst.executemany('INSERT OR REPLACE INTO actions(id, ts, hour, bot_handle, action, target_uri, note) VALUES(?,?,?,?,?,?,?)',
+                                [(r[0], r[1], _hour(r[1])) + tuple(r[2:]) for r in rows])
+                if parquet_dir:
+                    staged.extend(_write_parquet(parquet_dir, "actions", cols, rows))
+                touched.update(_hour(r[1]) for r in rows)
+                last = rows[-1][0]; counts["actions"] += len(rows)
+                _set(dst, "actions.last_id", last)
+
+            last = int(_get(dst, "replies.last_id") or 0)
+            while True:
+                rows = src.execute('SELECT id, ts, bot_handle, source, status FROM reply_queue WHERE id > ? ORDER BY id LIMIT ?', (last, batch)).fetchall()
+                if not rows:
+                    break
+                dst.executemany('INSERT OR REPLACE INTO replies(id, ts, hour, bot_handle, source, status) VALUES(?,?,?,?,?,?)',
+                                [(r[0], r[1], _hour(r[1])) + tuple(r[2:]) for r in rows])
+                touched.update(_hour(r[1]) for r in rows)
+                last = rows[-1][0]; counts["replies"] += len(rows)
+                _set(dst, "replies.last_id", last)
+
+            # queue rows still pending/retry may have been approved, posted or rejected since
+            open_rows = dst.execute('SELECT id, status, hour FROM replies WHERE status IN (%s)' % ",".join(["?"] * len(OPEN_STATUSES)), OPEN_STATUSES).fetchall()
+            known = {r[0]: (r[1], r[2]) for r in open_rows}
+            for chunk in _chunks(known):
+                for item_id, status in src.execute('SELECT id, status FROM reply_queue WHERE id IN (%s)' % ",".join(["?"] * len(chunk)), chunk):
+                    if status != known[item_id][0]:
+                        dst.execute('UPDATE replies SET status=? WHERE id=?', (status, item_id))
+                        touched.add(known[item_id][1]); counts["replies_updated"] += 1
+
+            _rollup(dst, touched)
+            counts["hours"] = len(touched)
+            _set(dst, "exported_at", datetime.now(timezone.utc).isoformat())
+    except BaseException:
+        for path in staged:
+            path.unlink(missing_ok=True)
+        raise
+    finally:
+        src.close()
+    for path in staged:
+        path.replace(path.with_name(path.name[1:-len(".tmp")]))
+    return counts
+
+# ---------- read side (web UI) ----------
+
+@contextmanager
+def _read_conn(db_path: str):
+    conn = sqlite3.connect("file:%s?mode=ro" % db_path, uri=True) if Path(db_path).exists() else None
+    try:
+        yield conn
+    finally:
+        if conn:
+            conn.close()
+
+def hourly(hours: int = 24, bot_handle: Optional[str] = None, metric: Optional[str] = None, db_path: str = ANALYTICS_DB) -> List[Dict[str, Any]]:
+    q = 'SELECT hour, bot_handle, metric, n FROM hourly WHERE hour >= ?'
+    params = [_since(hours)]
+    if bot_handle:
+        q += " AND bot_handle=?"; params.append(bot_handle)
+    if metric:
+        q += " AND metric=?"; params.append(metric)
+    q += " ORDER BY hour ASC, bot_handle ASC, metric ASC"
+    with _read_conn(db_path) as conn:
+        if conn is None:
+            return []
+        cur = conn.execute(q, params)
+        cols = [x[0] for x in cur.description]
+        return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+def summary(hours: int = 24, db_path: str = ANALYTICS_DB) -> Dict[str, Any]:
+    """
+    Per-bot totals over the window.
+    llm_skip_rate = llm_skip / (llm_skip + reply decisions), where reply decisions are queued rows plus direct
+    replies (reply actions minus queue rows later drained as status=posted, which also log a reply action).
+    """
+    with _read_conn(db_path) as conn:
+        if conn is None:
+            return {"hours": int(hours), "exported_at": None, "bots": {}}
+        rows = conn.execute('SELECT bot_handle, metric, SUM(n) FROM hourly WHERE hour >= ? GROUP BY bot_handle, metric', (_since(hours),)).fetchall()
+        exported = conn.execute("SELECT value FROM export_state WHERE key='exported_at'").fetchone()
+    bots = {}
+    for bot, metric, n in rows:
+        bots.setdefault(bot, {})[metric] = int(n or 0)
+    for bot, m in bots.items():
+        queued = sum(v for k, v in m.items() if k.startswith("queue."))
+        decisions = queued + max(0, m.get("reply", 0) - m.get("queue.posted", 0))
+        skips = m.get("llm_skip", 0)
+        m["replies_posted"] = m.get("reply", 0) + m.get("approved_post", 0)
+        m["queued"] = queued
+        m["llm_skip_rate"] = round(skips / float(skips + decisions), 4) if (skips + decisions) else None
+    return {"hours": int(hours), "exported_at": exported[0] if exported else None, "bots": bots}
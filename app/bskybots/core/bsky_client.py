@@ -1,7 +1,35 @@
-import re
+import re, time
+from email.utils import parsedate_to_datetime
 from atproto import Client, models
 from .utils import now_iso
 
+MAX_RETRY_AFTER = 3600   # never trust a header to park a bot for longer than this
+
+def retry_after_seconds(err, default=60, max_wait=MAX_RETRY_AFTER):
+    """
+    Seconds to back off if err is an upstream 429, else None.
+    Honours Retry-After (seconds or HTTP date) and ratelimit-reset (epoch seconds), clamped to [0, max_wait].
+    """
+    response = getattr(err, "response", None)
+    if getattr(response, "status_code", None) != 429:
+        return None
+    headers = {str(k).lower(): v for k, v in (getattr(response, "headers", None) or {}).items()}
+    wait = None
+    ra = headers.get("retry-after")
+    if ra:
+        try:
+            wait = float(ra)
+        except ValueError:
+            try: wait = parsedate_to_datetime(ra).timestamp() - time.time()
+            except Exception: pass
+    reset = headers.get("ratelimit-reset")
+    if wait is None and reset:
+        try: wait = float(reset) - time.time()
+        except ValueError: pass
+    if wait is None or wait != wait:   # missing/unparseable, or NaN
+        wait = default
+    return min(float(max_wait), max(0.0, float(wait)))
+
 class BskyClient:
     """
     Wrapper around atproto.Client with optional custom PDS. 
@@ -12,6 +40,20 @@ class BskyClient:
         self.profile = self.client.login(identifier, app_password)
         self.handle = self.profile.handle
         self.did = self.profile.did
+        self.throttled_until = 0.0
+
+    def throttled(self):
+        return time.time() < self.throttled_until
+
+    def _call(self, fn, *args, **kwargs):
+        # remember upstream 429s so callers can stop polling until Retry-After has passed
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            wait = retry_after_seconds(e)
+            if wait is not None:
+                self.throttled_until = max(self.throttled_until, time.time() + wait)
+            raise
 
     # ---------- helpers ----------
     def _normalize_at_uri(self, s: str) -> str:
@@ -40,7 +82,7 @@ class BskyClient:
             params = models.AppBskyFeedGetPostThread.Params(uri=uri, depth=0, parent_height=10)
         except TypeError:
             params = models.AppBskyFeedGetPostThread.Params(uri=uri, depth=0)
-        thread = self.client.app.bsky.feed.get_post_thread(params=params)
+        thread = self._call(self.client.app.bsky.feed.get_post_thread, params=params)
 
         node = thread.thread  # union: should be ThreadViewPost
         def post_of(n):
@@ -62,16 +104,16 @@ class BskyClient:
         params = models.AppBskyNotificationListNotifications.Params(
             limit=limit, reasons=["mention", "reply"]
         )
-        res = self.client.app.bsky.notification.list_notifications(params=params)
+        res = self._call(self.client.app.bsky.notification.list_notifications, params=params)
         return res.notifications or []
 
     def mark_notifications_seen(self):
         data = models.AppBskyNotificationUpdateSeen.Data(seen_at=now_iso())
-        self.client.app.bsky.notification.update_seen(data)
+        self._call(self.client.app.bsky.notification.update_seen, data)
 
     def search_posts(self, query: str, since: str = None, limit: int = 20):
         params = models.AppBskyFeedSearchPosts.Params(q=query, limit=limit)
-        res = self.client.app.bsky.feed.search_posts(params)
+        res = self._call(self.client.app.bsky.feed.search_posts, params)
         return res.posts or []
 
     def send_reply(self, text: str, parent_uri: str):
@@ -83,4 +125,4 @@ class BskyClient:
         text = (text or "")[:300]
         reply_ref = self._reply_ref(parent_uri)
         # High-level helper composes createRecord correctly across SDK versions
-        return self.client.send_post(text=text, reply_to=reply_ref, langs=["en"])
+        return self._call(self.client.send_post, text=text, reply_to=reply_ref, langs=["en"])
@@ -0,0 +1,53 @@
+import time
+
+class PollSchedule:
+    """
+    Adaptive per-bot poll interval.
+    - record(activity): snap to min_seconds when something new arrived and stay there for hold_seconds,
+      then back off x backoff per idle poll up to max_seconds
+    - an upstream throttle (Retry-After) pushes next_due out regardless of the interval
+    - defer(until): push the next poll past a throttle hit outside a poll (e.g. by shared search)
+    - touch(): activity seen outside a poll (shared search hits) pulls the next poll in to min_seconds
+    - due(): whether the bot should be polled now
+    """
+    def __init__(self, min_seconds=5, max_seconds=300, backoff=1.5, hold_seconds=60):
+        self.interval = 0.0
+        self.next_due = 0.0
+        self.last_active = None
+        self.throttled_until = 0.0
+        self.configure(min_seconds, max_seconds, backoff, hold_seconds)
+        self.interval = self.min_seconds
+
+    def configure(self, min_seconds, max_seconds, backoff=1.5, hold_seconds=60):
+        self.min_seconds = max(0.0, float(min_seconds))
+        self.max_seconds = max(self.min_seconds, float(max_seconds))
+        self.backoff = max(1.0, float(backoff))
+        self.hold_seconds = max(0.0, float(hold_seconds))
+        self.interval = min(self.max_seconds, max(self.min_seconds, self.interval))
+
+    def record(self, activity, throttled_until=0.0, now=None):
+        now = time.time() if now is None else now
+        if activity:
+            self.last_active = now
+        if self.last_active is not None and now - self.last_active < self.hold_seconds:
+            self.interval = self.min_seconds
+        else:
+            self.interval = min(self.max_seconds, max(self.min_seconds, self.interval * self.backoff))
+        self.throttled_until = throttled_until or 0.0
+        self.next_due = max(now + self.interval, self.throttled_until)
+        return self.next_due
+
+    def defer(self, until):
+        self.throttled_until = max(self.throttled_until, until or 0.0)
+        self.next_due = max(self.next_due, self.throttled_until)
+        return self.next_due
+
+    def touch(self, now=None):
+        now = time.time() if now is None else now
+        self.last_active = now
+        self.interval = self.min_seconds
+        self.next_due = max(min(self.next_due, now + self.interval), self.throttled_until)
+        return self.next_due
+
+    def due(self, now=None):
+        return (time.time() if now is None else now) >= self.next_due
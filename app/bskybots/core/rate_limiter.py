@@ -7,6 +7,7 @@ class RateLimiter:
     - can(): prune & check capacity (NO consume)
     - take(): prune & consume a slot if available (returns True/False)
     - allow(): alias to take() for backward compat
+    - resize(): change capacity in place, keeping recorded events
     """
     def __init__(self, max_events, window_seconds):
         self.max_events = int(max_events)
@@ -29,5 +30,10 @@ class RateLimiter:
             return True
         return False
 
+    def resize(self, max_events, window_seconds=None):
+        self.max_events = int(max_events)
+        if window_seconds is not None:
+            self.window = float(window_seconds)
+
     def allow(self):  # backward-compatible alias
         return self.take()
@@ -0,0 +1,26 @@
+import bisect, hashlib
+
+def _hash(key):
+    return int(hashlib.md5(key.encode("utf-8")).hexdigest()[:16], 16)
+
+class HashRing:
+    """
+    Consistent hash ring over shard ids.
+    - shard_for(key): stable owner of a key (bot handle)
+    - adding/removing a bot only touches the shard that owns it
+    """
+    def __init__(self, shards, replicas=64):
+        self.ring = sorted((_hash("shard-%s#%d" % (s, r)), s) for s in shards for r in range(replicas))
+        self.keys = [h for h, _ in self.ring]
+
+    def shard_for(self, key):
+        i = bisect.bisect(self.keys, _hash((key or "").lower())) % len(self.keys)
+        return self.ring[i][1]
+
+def partition(bots, n):
+    """Split bot configs into {shard_id: [bot_cfg, ...]} by consistent hash of handle."""
+    ring = HashRing(range(int(n)))
+    out = {i: [] for i in range(int(n))}
+    for b in bots:
+        out[ring.shard_for(b["handle"])].append(b)
+    return out
@@ -46,6 +46,12 @@ def mark_seen(uri: str):
     with get_conn() as conn:
         conn.execute('INSERT OR REPLACE INTO posts_seen(uri, seen_at) VALUES(?, datetime("now"))', (uri,))
 
+def claim_seen(uri: str) -> bool:
+    """Mark uri seen; True only for the first caller (atomic across processes sharing the DB)."""
+    with get_conn() as conn:
+        cur = conn.execute('INSERT OR IGNORE INTO posts_seen(uri, seen_at) VALUES(?, datetime("now"))', (uri,))
+        return cur.rowcount == 1
+
 def is_seen(uri: str) -> bool:
     with get_conn() as conn:
         cur = conn.execute('SELECT 1 FROM posts_seen WHERE uri=?', (uri,))
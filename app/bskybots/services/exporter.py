@@ -0,0 +1,28 @@
+import argparse, logging, sys, time
+from ..core import analytics, store
+
+def main():
+    ap = argparse.ArgumentParser(description="Incremental analytics export (actions/reply_queue -> analytics.db rollups)")
+    ap.add_argument("--db", default=store.DEFAULT_DB, help="live bots DB (opened read-only)")
+    ap.add_argument("--out", default=analytics.ANALYTICS_DB, help="analytics DB")
+    ap.add_argument("--parquet", default=None, help="also append actions as partitioned Parquet under this dir (needs pyarrow)")
+    ap.add_argument("--interval", type=int, default=300, help="seconds between exports")
+    ap.add_argument("--once", action="store_true")
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    while True:
+        try:
+            t0 = time.time()
+            counts = analytics.export(hot_db=args.db, db_path=args.out, parquet_dir=args.parquet)
+            logging.info("[export] %s in %.2fs", counts, time.time() - t0)
+        except Exception as e:
+            if args.once:
+                raise
+            logging.exception("[export] failed: %s", e)
+        if args.once:
+            return
+        time.sleep(args.interval)
+
+if __name__ == "__main__":
+    main()
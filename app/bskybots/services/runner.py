@@ -1,18 +1,212 @@
-import argparse, logging, sys, time, yaml
+import argparse, json, logging, os, signal, sys, time, yaml
 from pathlib import Path
 from ..core import store
-from .worker_bot import BotWorker
+from ..core.utils import now_iso
+from .worker_bot import BotWorker, parse_settings
+from .search_service import SharedSearch
 
 def load_yaml(path):
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
+def validate_bots(bots):
+    if not isinstance(bots, list):
+        raise ValueError("'bots' must be a list")
+    seen = set()
+    for i, b in enumerate(bots):
+        handle = b.get("handle") if isinstance(b, dict) else None
+        if not handle:
+            raise ValueError("bots[%d] has no handle" % i)
+        if handle in seen:
+            raise ValueError("duplicate bot handle %s" % handle)
+        seen.add(handle)
+    return bots
+
+def load_bots(path):
+    return validate_bots((load_yaml(path) or {}).get("bots") or [])
+
+def validate_config(bots, global_cfg):
+    """Parse every setting the fleet will apply, so a bad value fails here and not halfway through sync()."""
+    if not isinstance(global_cfg, dict):
+        raise ValueError("global config must be a mapping")
+    SharedSearch.settings(global_cfg.get("search"))
+    for b in bots:
+        try:
+            parse_settings(b, global_cfg)
+        except (TypeError, ValueError, AttributeError) as e:
+            raise ValueError("%s: %s" % (b["handle"], e))
+
+class ConfigSource:
+    """
+    bots.yaml + global.yaml + system prompt.
+    - changed(): True after SIGHUP or when any file's mtime moved
+    - load(): (bots, global_cfg); select() narrows bots (e.g. to one shard)
+    """
+    def __init__(self, config_path, global_path, prompt_path, select=None):
+        self.paths = (config_path, global_path, prompt_path)
+        self.prompt_path = prompt_path
+        self.select = select
+        self.mtimes = None
+        self.hup = False
+
+    def _stat(self):
+        out = []
+        for p in self.paths:
+            try: out.append(os.stat(p).st_mtime)
+            except OSError: out.append(None)
+        return out
+
+    def changed(self):
+        return self.hup or self._stat() != self.mtimes
+
+    def load(self):
+        self.hup = False
+        self.mtimes = self._stat()
+        bots = load_bots(self.paths[0])
+        global_cfg = load_yaml(self.paths[1]) or {}
+        bots = self.select(bots) if self.select else bots
+        validate_config(bots, global_cfg)
+        return bots, global_cfg
+
+class Fleet:
+    """Live BotWorkers keyed by handle; sync() only touches bots whose config changed."""
+    def __init__(self, prompt_path):
+        self.prompt_path = prompt_path
+        self.workers = {}
+        self.global_cfg = {}
+        self.search = None   # SharedSearch when global.yaml search.shared is on
+
+    def sync(self, bots, global_cfg, strict=False):
+        validate_config(bots, global_cfg)   # raises before any worker changes
+        self.global_cfg = global_cfg
+        wanted = {b["handle"]: b for b in bots}
+        for h in [h for h in self.workers if h not in wanted]:
+            del self.workers[h]
+            logging.info("[reload] removed %s", h)
+        for h, b in wanted.items():
+            w = self.workers.get(h)
+            try:
+                if w is not None and not w.needs_relogin(b):
+                    w.apply_config(b, global_cfg, self.prompt_path)
+                    continue
+                self.workers[h] = BotWorker(b, global_cfg, self.prompt_path)
+                if w is not None:
+                    # a new session, but the same posting budget
+                    for name in ("limiter_min", "limiter_hour", "llm_limiter"):
+                        getattr(self.workers[h], name).events = getattr(w, name).events
+                    logging.info("[reload] re-logged %s (credentials changed)", h)
+                elif not strict:
+                    logging.info("[reload] added %s", h)
+            except Exception as e:
+                if strict:
+                    raise
+                logging.exception("[reload] failed to apply config for %s: %s", h, e)
+        self._sync_search()
+
+    def _sync_search(self):
+        cfg = self.global_cfg.get("search") or {}
+        shared = bool(cfg.get("shared", True))
+        if shared and self.search is None:
+            self.search = SharedSearch()
+        elif not shared:
+            self.search = None
+        for w in self.workers.values():
+            w.search_external = shared
+        if self.search:
+            self.search.configure(cfg)
+            self.search.subscribe(list(self.workers.values()))
+
+def reload_fleet(fleet, source):
+    try:
+        bots, global_cfg = source.load()
+    except Exception as e:
+        logging.error("[reload] keeping current config, failed to load: %s", e); return
+    fleet.sync(bots, global_cfg)
+    logging.info("[reload] %d bot(s) active", len(fleet.workers))
+
+def _single_health(fleet, status="ok"):
+    # same shape as Supervisor.health(), so /api/health reads either mode
+    bots = sorted(fleet.workers)
+    return {"status": status, "ts": now_iso(), "supervisor_pid": None, "bots": len(bots),
+            "shards": [{"id": 0, "pid": os.getpid(), "alive": status != "stopped", "status": status,
+                        "bots": bots, "restarts": 0, "heartbeat": now_iso()}]}
+
+def run_loop(source, once=False, heartbeat=None, health_key=None):
+    """
+    heartbeat: state key refreshed every 10s (shards, read by the supervisor)
+    health_key: state key for a single-process health record (runner without a supervisor)
+    """
+    bots, global_cfg = source.load()
+    fleet = Fleet(source.prompt_path)
+    fleet.sync(bots, global_cfg, strict=True)
+    if once:
+        for w in fleet.workers.values():
+            w.run_once()
+        if fleet.search:
+            fleet.search.run_due()
+        return
+
+    def on_hup(signum, frame):
+        source.hup = True
+    signal.signal(signal.SIGHUP, on_hup)
+
+    if health_key:
+        # systemd stops us with SIGTERM; exit through finally so the health record says "stopped"
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # each bot is polled on its own adaptive schedule (see PollSchedule)
+    last_beat = 0.0
+    try:
+        while True:
+            if source.changed():
+                reload_fleet(fleet, source)
+            now = time.time()
+            for w in list(fleet.workers.values()):
+                if not w.schedule.due(now):
+                    continue
+                if w.client.throttled():
+                    # the session hit a 429 outside its own poll (shared search); wait out Retry-After
+                    w.schedule.defer(w.client.throttled_until)
+                    continue
+                activity = 0
+                try:
+                    activity = w.run_once() or 0
+                except Exception as e:
+                    if w.client.throttled():
+                        logging.warning("[%s] throttled upstream: %s", w.bot_handle, e)
+                    else:
+                        logging.exception("Worker crashed: %s", e)
+                w.schedule.record(activity, throttled_until=w.client.throttled_until)
+            if fleet.search:
+                try:
+                    fleet.search.run_due()
+                except Exception as e:
+                    logging.exception("Shared search crashed: %s", e)
+            if (heartbeat or health_key) and time.time() - last_beat >= 10:
+                if heartbeat:
+                    store.set_state(heartbeat, now_iso())
+                if health_key:
+                    store.set_state(health_key, json.dumps(_single_health(fleet)))
+                last_beat = time.time()
+            dues = [w.schedule.next_due for w in fleet.workers.values()]
+            if fleet.search and fleet.search.next_due() is not None:
+                dues.append(fleet.search.next_due())
+            next_due = min(dues or [time.time() + 5])
+            # wake at least every 5s to notice config edits
+            deadline = min(next_due, time.time() + 5)
+            while time.time() < deadline and not source.hup:
+                time.sleep(min(1.0, max(0.0, deadline - time.time())))
+    finally:
+        if health_key:
+            store.set_state(health_key, json.dumps(_single_health(fleet, "stopped")))
+
 def main():
     ap = argparse.ArgumentParser(description="Bluesky multi-bot runner")
     ap.add_argument("--config", "-c", default="/etc/bsky-bots/bots.yaml")
     ap.add_argument("--global-config", "-g", default="/etc/bsky-bots/global.yaml")
     ap.add_argument("--prompt", "-p", default="/opt/bsky-bots/prompts/system_prompt.txt")
     ap.add_argument("--once", action="store_true")
+    ap.add_argument("--shards", type=int, default=None, help="worker processes (default: global.yaml shards, else 1)")
     args = ap.parse_args()
 
     Path("/var/lib/bsky-bots").mkdir(parents=True, exist_ok=True)
@@ -21,32 +215,29 @@ def main():
 
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(message)s",
+        format="%(asctime)s %(levelname)s %(processName)s %(message)s",
         handlers=[logging.FileHandler("/var/log/bsky-bots/bots.log"), logging.StreamHandler(sys.stdout)],
     )
 
-    bots_cfg = load_yaml(args.config) or {}
     global_cfg = load_yaml(args.global_config) or {}
-    bots = bots_cfg.get("bots", [])
+    try:
+        bots = load_bots(args.config)
+        validate_config(bots, global_cfg)
+    except Exception as e:
+        logging.error("Invalid config (%s, %s): %s", args.config, args.global_config, e)
+        sys.exit(2)
     if not bots:
         logging.error("No bots configured in %s", args.config)
         sys.exit(2)
 
-    workers = [BotWorker(b, global_cfg, args.prompt) for b in bots]
-    if args.once:
-        for w in workers:
-            w.run_once()
+    shards = args.shards if args.shards is not None else int(global_cfg.get("shards", 1))
+    from .supervisor import HEALTH_KEY, Supervisor
+    if args.once or shards <= 1:
+        run_loop(ConfigSource(args.config, args.global_config, args.prompt), once=args.once,
+                 health_key=None if args.once else HEALTH_KEY)
         return
 
-    # simple loop
-    sleep_s = int(global_cfg.get("loop_sleep_seconds", 20))
-    while True:
-        for w in workers:
-            try:
-                w.run_once()
-            except Exception as e:
-                logging.exception("Worker crashed: %s", e)
-        time.sleep(sleep_s)
+    Supervisor(args.config, args.global_config, args.prompt, shards, load_bots).run()
 
 if __name__ == "__main__":
     main()
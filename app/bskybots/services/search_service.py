@@ -0,0 +1,109 @@
+import logging, time
+from ..core import store
+
+class SharedSearch:
+    """
+    One search_posts call per distinct keyword per interval; the results are shared by every bot tracking it.
+    - keywords are normalised (strip/lower) and deduplicated across bots
+    - a per-keyword high-water mark (indexed_at + recent uris) drops posts already processed
+    - each new post is offered round-robin to subscribers whose filters accept it; it is claimed in posts_seen
+      (atomic, shared by every shard) just before the first of them handles it, so a post nobody here wants stays
+      available to another shard's bots
+    - a bot that declines passes the post on; a bot that fails drops it, so an LLM outage costs one attempt per post;
+      the bot that takes it counts that as activity on its poll schedule
+    - each shard searches the keywords its own bots track; posts_seen keeps replies at most once fleet-wide
+    """
+    def __init__(self, interval_seconds=30, limit=20, recent_max=1000):
+        self.subs = {}       # keyword -> [BotWorker, ...]
+        self.last = {}       # keyword -> last search time (this process)
+        self.hwm = {}        # keyword -> newest indexed_at processed
+        self.recent = {}     # keyword -> {uri: None} (insertion ordered, bounded)
+        self.turn = {}       # keyword -> round-robin offset
+        self.recent_max = int(recent_max)
+        self.configure({"interval_seconds": interval_seconds, "limit": limit})
+
+    @staticmethod
+    def settings(cfg):
+        """(interval_seconds, limit) from global.yaml search; raises on bad values."""
+        cfg = cfg or {}
+        return float(cfg.get("interval_seconds", 30)), int(cfg.get("limit", 20))
+
+    def configure(self, cfg):
+        self.interval, self.limit = self.settings(cfg)
+
+    def subscribe(self, workers):
+        subs = {}
+        for w in workers:
+            for kw in w.search_keywords():
+                key = (kw or "").strip().lower()
+                if key and w not in subs.setdefault(key, []):
+                    subs[key].append(w)
+        for key in [k for k in self.last if k not in subs]:
+            for d in (self.last, self.hwm, self.recent, self.turn):
+                d.pop(key, None)
+        self.subs = subs
+
+    def next_due(self):
+        if not self.subs:
+            return None
+        return min(self.last.get(k, 0.0) + self.interval for k in self.subs)
+
+    def _fresh(self, key, posts):
+        hwm = newest = self.hwm.get(key)
+        recent = self.recent.setdefault(key, {})
+        fresh = []
+        for p in posts or []:
+            ts = getattr(p, "indexed_at", None)
+            if p.uri in recent or (ts and hwm and ts < hwm):
+                continue
+            fresh.append(p)
+            recent[p.uri] = None
+            if ts and (not newest or ts > newest):
+                newest = ts
+        self.hwm[key] = newest
+        while len(recent) > self.recent_max:
+            del recent[next(iter(recent))]
+        return fresh
+
+    def _fetch(self, key):
+        # any subscriber's session will do; skip ones that are throttled upstream
+        for w in self.subs[key]:
+            if w.client.throttled():
+                continue
+            try:
+                posts = w.client.search_posts(query=key, limit=self.limit)
+            except Exception as e:
+                logging.warning("[search] %r via %s failed: %s", key, w.bot_handle, e)
+                continue
+            return posts
+        return []
+
+    def run_due(self, now=None):
+        """Search every keyword whose interval has elapsed; returns the number of new posts handled."""
+        now = time.time() if now is None else now
+        handled = 0
+        for key, workers in self.subs.items():
+            if now - self.last.get(key, 0.0) < self.interval:
+                continue
+            self.last[key] = now
+            fresh = self._fresh(key, self._fetch(key))
+            for p in fresh:
+                start = self.turn.get(key, 0)
+                order = workers[start:] + workers[:start]
+                self.turn[key] = (start + 1) % len(workers)
+                claimed = False
+                for w in order:
+                    if not w.wants_search_post(p):
+                        continue
+                    if not claimed:
+                        if not store.claim_seen(p.uri):
+                            break   # already handled (a mention, or another shard)
+                        claimed = True; handled += 1
+                    try:
+                        if w.handle_search_post(p):
+                            w.schedule.touch(now)
+                            break
+                    except Exception as e:
+                        logging.exception("[search] %s failed on %s: %s", w.bot_handle, p.uri, e)
+                        break
+        return handled
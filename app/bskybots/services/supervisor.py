@@ -0,0 +1,194 @@
+import json, logging, multiprocessing as mp, os, signal, time
+from datetime import datetime
+from ..core import store
+from ..core.sharding import partition
+from ..core.utils import now_iso
+
+HEALTH_KEY = "runner.health"
+
+def heartbeat_key(shard_id):
+    return "shard.%d.heartbeat" % shard_id
+
+def _heartbeat_age(value, now):
+    try:
+        return now - datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def _shard_main(shard_id, n, config_path, global_path, prompt_path):
+    # forked children inherit the supervisor's handlers; let systemd/terminate() stop us directly
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)  # until run_loop installs its reload handler
+    from .runner import ConfigSource, run_loop
+    logging.info("[shard %d] pid=%d starting", shard_id, os.getpid())
+    # each shard re-reads the config itself and keeps only the bots hashed to it
+    source = ConfigSource(config_path, global_path, prompt_path, select=lambda bots: partition(bots, n)[shard_id])
+    run_loop(source, heartbeat=heartbeat_key(shard_id))
+
+class Shard:
+    def __init__(self, shard_id):
+        self.id = shard_id
+        self.bots = []
+        self.proc = None
+        self.started = 0.0
+        self.restarts = 0
+        self.failures = 0   # consecutive crashes, drives restart backoff
+        self.due = None     # earliest restart time after a crash
+
+    def alive(self):
+        return bool(self.proc and self.proc.is_alive())
+
+class Supervisor:
+    """
+    Runs bots.yaml across N worker processes (one GIL each).
+    - bots are assigned to shards by consistent hash of handle
+    - a crashed shard is restarted on its own, with exponential backoff
+    - config edits are applied by the shards in place (SIGHUP is forwarded); nothing restarts
+    - aggregated health is written to state[runner.health] every tick; a shard whose heartbeat is
+      older than stale_seconds counts as degraded even if its process is alive
+    """
+    def __init__(self, config_path, global_path, prompt_path, shards, load_bots, tick_seconds=5, stable_seconds=300,
+                 stale_seconds=None):
+        self.config_path = config_path
+        self.global_path = global_path
+        self.prompt_path = prompt_path
+        self.n = int(shards)
+        self.load_bots = load_bots
+        self.tick_seconds = float(tick_seconds)
+        self.stable_seconds = float(stable_seconds)
+        # run_loop beats at most every 10s; allow a few missed ticks before calling a shard stuck
+        self.stale_seconds = float(stale_seconds) if stale_seconds else max(60.0, 6 * self.tick_seconds)
+        self.shards = {i: Shard(i) for i in range(self.n)}
+        self.running = True
+        self.mtime = None
+        self.status = None
+
+    # ---------- process control ----------
+    def _start(self, sh):
+        # _shard_main relies on fork: the child inherits the supervisor's logging handlers
+        sh.proc = mp.get_context("fork").Process(target=_shard_main, args=(sh.id, self.n, self.config_path, self.global_path, self.prompt_path),
+                             name="bsky-shard-%d" % sh.id, daemon=True)
+        sh.proc.start()
+        sh.started = time.time(); sh.due = None
+        logging.info("[supervisor] shard %d started pid=%s (%d bots)", sh.id, sh.proc.pid, len(sh.bots))
+
+    def _stop(self, sh, timeout=10):
+        if not sh.proc:
+            return
+        if sh.proc.is_alive():
+            sh.proc.terminate()
+            sh.proc.join(timeout)
+            if sh.proc.is_alive():
+                sh.proc.kill(); sh.proc.join(timeout)
+        sh.proc = None
+
+    def _hup(self, sh):
+        if sh.alive():
+            os.kill(sh.proc.pid, signal.SIGHUP)
+
+    def rebalance(self, bots):
+        parts = partition(bots, self.n)
+        for sid, sh in self.shards.items():
+            if parts[sid] == sh.bots:
+                continue
+            logging.info("[supervisor] shard %d bots changed: %d -> %d", sid, len(sh.bots), len(parts[sid]))
+            sh.bots = parts[sid]
+            if sh.alive():
+                self._hup(sh)
+            elif sh.bots and sh.due is None:
+                sh.failures = 0
+                self._start(sh)
+
+    def _reload_if_changed(self):
+        try:
+            mtime = os.stat(self.config_path).st_mtime
+        except OSError as e:
+            logging.error("[supervisor] cannot stat %s: %s", self.config_path, e); return
+        if mtime == self.mtime:
+            return
+        self.mtime = mtime   # a broken file is reported once, not every tick
+        try:
+            bots = self.load_bots(self.config_path)
+        except Exception as e:
+            logging.error("[supervisor] keeping previous assignment, failed to load %s: %s", self.config_path, e); return
+        if not bots:
+            logging.error("[supervisor] no bots configured in %s; keeping previous assignment", self.config_path); return
+        self.rebalance(bots)
+
+    def _check(self):
+        now = time.time()
+        for sh in self.shards.values():
+            if not sh.bots:
+                continue
+            if sh.alive():
+                if sh.failures and now - sh.started > self.stable_seconds:
+                    sh.failures = 0
+                continue
+            if sh.due is None:
+                sh.failures += 1; sh.restarts += 1
+                delay = min(60, 2 ** (sh.failures - 1))
+                sh.due = now + delay
+                logging.warning("[supervisor] shard %d exited (code=%s); restarting in %ss",
+                                sh.id, sh.proc.exitcode if sh.proc else None, delay)
+            if now >= sh.due:
+                self._start(sh)
+
+    # ---------- health ----------
+    def _shard_status(self, sh, beat, now):
+        if not sh.alive():
+            return "down"
+        age = _heartbeat_age(beat, now)
+        # a fresh process gets stale_seconds to log in and write its first beat
+        if now - sh.started > self.stale_seconds and (age is None or age > self.stale_seconds):
+            return "degraded"
+        return "ok"
+
+    def health(self):
+        now = time.time()
+        shards = []
+        for sh in self.shards.values():
+            beat = store.get_state(heartbeat_key(sh.id))
+            shards.append({
+                "id": sh.id, "pid": sh.proc.pid if sh.alive() else None, "alive": sh.alive(),
+                "status": self._shard_status(sh, beat, now) if sh.bots else "idle",
+                "bots": [b["handle"] for b in sh.bots], "restarts": sh.restarts,
+                "heartbeat": beat,
+            })
+        active = [s for s in shards if s["bots"]]
+        status = "ok" if all(s["status"] == "ok" for s in active) else "degraded"
+        return {"status": status, "ts": now_iso(), "supervisor_pid": os.getpid(),
+                "bots": sum(len(s["bots"]) for s in shards), "shards": shards}
+
+    def _publish(self):
+        h = self.health()
+        store.set_state(HEALTH_KEY, json.dumps(h))
+        if h["status"] != self.status:
+            logging.info("[supervisor] health: %s (%d bots on %d shards)", h["status"], h["bots"], self.n)
+            self.status = h["status"]
+
+    # ---------- main loop ----------
+    def _on_hup(self, signum, frame):
+        logging.info("[supervisor] SIGHUP; forwarding to shards")
+        self.mtime = None
+        for sh in self.shards.values():
+            self._hup(sh)
+
+    def _on_signal(self, signum, frame):
+        logging.info("[supervisor] signal %s; stopping shards", signum)
+        self.running = False
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._on_signal)
+        signal.signal(signal.SIGINT, self._on_signal)
+        signal.signal(signal.SIGHUP, self._on_hup)
+        try:
+            while self.running:
+                self._reload_if_changed()
+                self._check()
+                self._publish()
+                time.sleep(self.tick_seconds)
+        finally:
+            for sh in self.shards.values():
+                self._stop(sh)
+            store.set_state(HEALTH_KEY, json.dumps(dict(self.health(), status="stopped")))
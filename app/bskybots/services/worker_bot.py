@@ -3,6 +3,7 @@ from pathlib import Path
 from ..core.bsky_client import BskyClient
 from ..core.openai_client import OpenAIClient
 from ..core.rate_limiter import RateLimiter
+from ..core.poll_schedule import PollSchedule
 from ..core import store
 from ..core.utils import now_iso, apply_persona
 from ..core.filters import allow_post
@@ -13,32 +14,85 @@ def _resolve_approval_mode(bot_cfg, global_cfg):
     if "approval_mode" in bot_cfg: return bool(bot_cfg["approval_mode"])
     return bool(global_cfg.get("approval_mode", False))
 
+_warned_legacy_sleep = False
+
+def _poll_defaults(global_cfg):
+    """global.yaml poll; an upgraded install without one keeps its old fixed loop_sleep_seconds interval."""
+    global _warned_legacy_sleep
+    poll = global_cfg.get("poll")
+    legacy = global_cfg.get("loop_sleep_seconds")
+    if poll or legacy is None:
+        return poll or {}
+    if not _warned_legacy_sleep:
+        logging.warning("loop_sleep_seconds is deprecated; polling every %ss. Replace it with a poll: block "
+                        "(see global.example.yaml) to enable adaptive polling", legacy)
+        _warned_legacy_sleep = True
+    return {"min_seconds": legacy, "max_seconds": legacy}
+
+def parse_settings(bot_cfg, global_cfg):
+    """A bot's effective settings (bots.yaml over global.yaml), validated; raises before anything is applied."""
+    openai_cfg = global_cfg.get("openai") or {}
+    rate = bot_cfg.get("rate_limit") or {}
+    # adaptive polling bounds: global.yaml poll, optionally overridden per bot
+    poll = dict(_poll_defaults(global_cfg), **(bot_cfg.get("poll") or {}))
+    return {
+        "nsfw_allowed": bool(bot_cfg.get("nsfw_allowed", False)),
+        "model": str(openai_cfg.get("model", "gpt-4o-mini")),
+        "temperature": float(openai_cfg.get("temperature", 0.7)),
+        "max_per_minute": int(rate.get("max_per_minute", 10)),
+        "max_per_hour": int(rate.get("max_per_hour", 100)),
+        "llm_per_minute": int(global_cfg.get("llm_rate_limit_per_minute", 20)),
+        "poll": (float(poll.get("min_seconds", 5)), float(poll.get("max_seconds", 300)),
+                 float(poll.get("backoff", 1.5)), float(poll.get("hold_seconds", 60))),
+        "persona": bot_cfg.get("persona", {"tone":"warm","emoji_density":1,"formality":1,"humour":1}),
+        "allow": bot_cfg.get("allow", {"users":[],"phrases":[],"hashtags":[]}),
+        "block": bot_cfg.get("block", {"users":[],"phrases":[],"hashtags":[]}),
+    }
+
+def _login_key(bot_cfg):
+    return (bot_cfg.get("identifier") or bot_cfg["handle"], bot_cfg.get("app_password"), bot_cfg.get("service"))
+
 class BotWorker:
     def __init__(self, bot_cfg, global_cfg, system_prompt_path):
-        self.cfg = bot_cfg; self.global_cfg = global_cfg
-        self.nsfw_allowed = bool(bot_cfg.get("nsfw_allowed", False))
         self.bot_handle = bot_cfg["handle"]
 
-        identifier = bot_cfg.get("identifier") or bot_cfg["handle"]
-        service = bot_cfg.get("service")
-        self.client = BskyClient(identifier, bot_cfg["app_password"], service=service)
+        identifier, app_password, service = _login_key(bot_cfg)
+        self.client = BskyClient(identifier, app_password, service=service)
+        self.llm = OpenAIClient()
+
+        self.limiter_min = RateLimiter(10, 60)
+        self.limiter_hour = RateLimiter(100, 3600)
+        self.llm_limiter = RateLimiter(20, 60)
+        self.schedule = PollSchedule()
+        self.search_external = False
+        Path("/var/log/bsky-bots").mkdir(parents=True, exist_ok=True)
+        self.apply_config(bot_cfg, global_cfg, system_prompt_path)
 
+    def needs_relogin(self, bot_cfg):
+        return _login_key(bot_cfg) != _login_key(self.cfg)
+
+    def apply_config(self, bot_cfg, global_cfg, system_prompt_path):
+        """
+        (Re)apply settings in place: keeps the Bluesky session, LLM client and limiter history.
+        Everything is parsed first, so a bad value leaves the previous settings untouched.
+        """
+        s = parse_settings(bot_cfg, global_cfg)
         with open(system_prompt_path, "r", encoding="utf-8") as f: system_prompt = f.read()
-        model = global_cfg.get("openai", {}).get("model", "gpt-4o-mini")
-        temp = float(global_cfg.get("openai", {}).get("temperature", 0.7))
-        self.llm = OpenAIClient(model=model, temperature=temp, system_prompt=system_prompt)
 
-        rate = bot_cfg.get("rate_limit", {"max_per_minute": 10, "max_per_hour": 100})
-        self.limiter_min = RateLimiter(rate.get("max_per_minute", 10), 60)
-        self.limiter_hour = RateLimiter(rate.get("max_per_hour", 100), 3600)
-        # throttle LLM calls (configurable in global.yaml)
-        self.llm_limiter = RateLimiter(int(global_cfg.get("llm_rate_limit_per_minute", 20)), 60)
+        self.cfg = bot_cfg; self.global_cfg = global_cfg
+        self.nsfw_allowed = s["nsfw_allowed"]
+        self.llm.model = s["model"]
+        self.llm.temperature = s["temperature"]
+        self.llm.system_prompt = system_prompt or "You are a helpful assistant."
 
-        self.sleep_seconds = int(global_cfg.get("loop_sleep_seconds", 20))
-        Path("/var/log/bsky-bots").mkdir(parents=True, exist_ok=True)
-        self.persona = bot_cfg.get("persona", {"tone":"warm","emoji_density":1,"formality":1,"humour":1})
-        self.allow = bot_cfg.get("allow", {"users":[],"phrases":[],"hashtags":[]})
-        self.block = bot_cfg.get("block", {"users":[],"phrases":[],"hashtags":[]})
+        self.limiter_min.resize(s["max_per_minute"])
+        self.limiter_hour.resize(s["max_per_hour"])
+        # throttle LLM calls (configurable in global.yaml)
+        self.llm_limiter.resize(s["llm_per_minute"])
+        self.schedule.configure(*s["poll"])
+        self.persona = s["persona"]
+        self.allow = s["allow"]
+        self.block = s["block"]
 
     def _limited(self):
         # PEEK only (do not consume)
@@ -53,7 +107,7 @@ class BotWorker:
         if approval:
             store.queue_reply(self.bot_handle, parent_uri, author_handle, source, original_text, reply_text, extra={})
             logging.info("[%s] queued reply for approval to %s", self.bot_handle, parent_uri); return
-        if self._limited():
+        if self._limited() or self.client.throttled():
             logging.info("[%s] Rate limited, queueing for retry.", self.bot_handle)
             store.queue_reply(self.bot_handle, parent_uri, author_handle, source, original_text, reply_text, status="retry")
             return
@@ -77,7 +131,7 @@ class BotWorker:
         # try to post a few queued items for this bot when capacity allows
         items = store.list_queue_multi(["retry"], bot_handle=self.bot_handle, limit=5)
         for it in items:
-            if self._limited(): return
+            if self._limited() or self.client.throttled(): return
             if not self._reserve_slot(): return
             try:
                 self.client.send_reply(it["llm_reply"], it["parent_uri"])
@@ -88,15 +142,60 @@ class BotWorker:
                 # keep status=retry for next loop
                 break
 
+    def search_keywords(self):
+        rules = self.cfg.get("reply_rules", {})
+        if not rules.get("allow_unprompted", False):
+            return []
+        return rules.get("keywords", []) or []
+
+    def wants_search_post(self, p):
+        """Cheap pre-check (author, allow/block lists, NSFW) before a search hit is claimed for this bot."""
+        author_handle = getattr(getattr(p, "author", None), "handle", "user")
+        if author_handle == self.bot_handle: return False
+        text = getattr(getattr(p, "record", None), "text", "")
+        return allow_post(text, author_handle, True, self.nsfw_allowed, self.allow, self.block)
+
+    def handle_search_post(self, p):
+        """
+        Consider an unprompted reply to a search hit (caller has already marked it seen).
+        Returns True if this bot took the post, False if it is left for another bot.
+        """
+        if not self.wants_search_post(p): return False
+        author_handle = getattr(getattr(p, "author", None), "handle", "user")
+        text = getattr(getattr(p, "record", None), "text", "")
+
+        # throttle LLM
+        if not self.llm_limiter.can():
+            logging.info("[LLM] throttled; skipping classify this cycle")
+            return False
+        self.llm_limiter.take()
+
+        thread_ctx = self._memory_for(author_handle)
+        data = self.llm.classify_and_generate(text=text, author=author_handle, nsfw_allowed=self.nsfw_allowed, persona=self.persona, thread_context=thread_ctx, target_lang="en")
+        if data.get("should_reply") and data.get("reply"):
+            final_reply = apply_persona(data["reply"], self.persona)
+            try:
+                self._post_or_queue(final_reply, parent_uri=p.uri, author_handle=author_handle, source="search", original_text=text)
+                self._update_memory(author_handle, text, final_reply)
+            except Exception as e:
+                logging.exception("Failed to post unprompted reply: %s", e)
+        else:
+            store.log_action(self.bot_handle, "llm_skip", target_uri=p.uri, note="search")
+        return True
+
     def run_once(self):
+        """One poll; returns how many new notifications/posts were seen (drives the adaptive schedule)."""
         # First drain any backlog created by rate limits
-        self._drain_queue()
+        if not self.client.throttled():
+            self._drain_queue()
+        activity = 0
 
         notifications = self.client.list_mentions_and_replies(limit=50)
         for n in notifications:
             uri = n.uri
             if store.is_seen(uri): continue
             store.mark_seen(uri)
+            activity += 1
             reason = getattr(n, "reason", "")
             record = getattr(n, "record", None)
             text = getattr(record, "text", "") if record else ""
@@ -119,17 +218,21 @@ class BotWorker:
                     self._update_memory(author_name, text, final_reply)
                 except Exception as e:
                     logging.exception("Failed to handle reply: %s", e)
+            else:
+                store.log_action(self.bot_handle, "llm_skip", target_uri=uri, note=reason)
 
-        try: self.client.mark_notifications_seen()
-        except Exception: pass
+        if not self.client.throttled():
+            try: self.client.mark_notifications_seen()
+            except Exception: pass
 
-        # Optional unprompted search
-        rules = self.cfg.get("reply_rules", {})
-        allow_unprompted = bool(rules.get("allow_unprompted", False))
-        keywords = rules.get("keywords", [])
+        # Optional unprompted search (done by the runner's SharedSearch when search_external is set)
+        if self.search_external:
+            return activity
+        keywords = self.search_keywords()
         since = store.get_state("since_%s" % self.bot_handle)
-        if allow_unprompted and keywords:
+        if keywords:
             for kw in keywords:
+                if self.client.throttled(): break
                 try: posts = self.client.search_posts(query=kw, since=since, limit=20)
                 except Exception: posts = []
                 for p in posts or []:
@@ -137,23 +240,8 @@ class BotWorker:
                     if author_handle == self.bot_handle: continue
                     if store.is_seen(p.uri): continue
                     store.mark_seen(p.uri)
-                    text = getattr(getattr(p, "record", None), "text", "")
-                    if not allow_post(text, author_handle, True, self.nsfw_allowed, self.allow, self.block): continue
-
-                    # throttle LLM
-                    if not self.llm_limiter.can():
-                        logging.info("[LLM] throttled; skipping classify this cycle")
-                        continue
-                    self.llm_limiter.take()
-
-                    thread_ctx = self._memory_for(author_handle)
-                    data = self.llm.classify_and_generate(text=text, author=author_handle, nsfw_allowed=self.nsfw_allowed, persona=self.persona, thread_context=thread_ctx, target_lang="en")
-                    if data.get("should_reply") and data.get("reply"):
-                        final_reply = apply_persona(data["reply"], self.persona)
-                        try:
-                            self._post_or_queue(final_reply, parent_uri=p.uri, author_handle=author_handle, source="search", original_text=text)
-                            self._update_memory(author_handle, text, final_reply)
-                        except Exception as e:
-                            logging.exception("Failed to post unprompted reply: %s", e)
+                    activity += 1
+                    self.handle_search_post(p)
 
             store.set_state("since_%s" % self.bot_handle, now_iso())
+        return activity
@@ -1,11 +1,12 @@
-from fastapi import FastAPI, Request, Form
+from fastapi import FastAPI, Request, Form, Query
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
-import yaml
+from typing import Optional
+import json, yaml
 
-from ..core import store
+from ..core import store, analytics
 from ..core.bsky_client import BskyClient
 
 app = FastAPI(title="Bluesky Bots UI")
@@ -57,3 +58,20 @@ def toggle_approval(handle: str = Form(...), mode: str = Form(...)):
     # mode: on/off
     store.set_state(f"approval.{handle}", "on" if mode == "on" else "off")
     return RedirectResponse("/", status_code=303)
+
+@app.get("/api/health")
+def health():
+    # written by the supervisor (shards > 1) or by the single-process runner
+    raw = store.get_state("runner.health")
+    if not raw:
+        return JSONResponse({"status": "unknown", "shards": []})
+    return JSONResponse(json.loads(raw))
+
+@app.get("/api/stats/summary")
+def stats_summary(hours: int = Query(24, ge=1, le=24 * 366)):
+    # served from analytics.db rollups (bsky-export), never from the live DB
+    return JSONResponse(analytics.summary(hours=hours))
+
+@app.get("/api/stats/hourly")
+def stats_hourly(hours: int = Query(24, ge=1, le=24 * 366), bot: Optional[str] = None, metric: Optional[str] = None):
+    return JSONResponse({"hours": hours, "rows": analytics.hourly(hours=hours, bot_handle=bot, metric=metric)})
@@ -25,6 +25,7 @@ cp -r static /opt/bsky-bots/
 cp scripts/bsky-bots.py /opt/bsky-bots/
 cp scripts/bsky-bots-ui.py /opt/bsky-bots/
 cp scripts/bsky-firehose.py /opt/bsky-bots/
+cp scripts/bsky-export.py /opt/bsky-bots/
 chown -R bskybots:bskybots /opt/bsky-bots
 
 # Python venv
@@ -53,10 +54,12 @@ echo "[*] Installing systemd services..."
 cp systemd/bsky-bots.service /etc/systemd/system/bsky-bots.service
 cp systemd/bsky-bots-ui.service /etc/systemd/system/bsky-bots-ui.service
 cp systemd/bsky-firehose.service /etc/systemd/system/bsky-firehose.service
+cp systemd/bsky-export.service /etc/systemd/system/bsky-export.service
 systemctl daemon-reload
 systemctl enable bsky-bots.service
 systemctl enable bsky-bots-ui.service
 systemctl enable bsky-firehose.service
+systemctl enable bsky-export.service
 
 echo "[*] Installation complete."
-echo "Edit /etc/bsky-bots/bots.yaml and /etc/bsky-bots.env, then start with: sudo systemctl start bsky-bots bsky-bots-ui bsky-firehose"
+echo "Edit /etc/bsky-bots/bots.yaml and /etc/bsky-bots.env, then start with: sudo systemctl start bsky-bots bsky-bots-ui bsky-firehose bsky-export"
@@ -0,0 +1,4 @@
+#!/usr/bin/env python3
+from bskybots.services.exporter import main
+if __name__ == "__main__":
+    main()